@@ -48,7 +48,7 @@ import asyncio
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 
 from lib.terminal_utils import LogBuffer, log
 from lib.market_manager import MarketManager, MarketInfo
@@ -77,7 +77,8 @@ class StrategyConfig:
     price_history_size: int = 100
 
     # Display settings
-    update_interval: float = 0.1
+    update_interval: float = 0.1  # Minimum seconds between loop iterations
+    idle_refresh_interval: float = 1.0  # Maximum seconds between iterations when idle
     order_refresh_interval: float = 30.0  # Seconds between order refreshes
 
 
@@ -124,6 +125,10 @@ class BaseStrategy(ABC):
         # State
         self.running = False
         self._status_mode = False
+        self._update_event: Optional[asyncio.Event] = None
+
+        # Latest (mid, spread) per asset, updated once per book update
+        self._quotes: Dict[str, Tuple[float, float]] = {}
 
         # Logging
         self._log_buffer = LogBuffer(max_size=5)
@@ -153,6 +158,19 @@ class BaseStrategy(ABC):
         """Get cached open orders."""
         return self._cached_orders
 
+    def get_quote(self, side: str) -> Tuple[float, float]:
+        """
+        Get cached quote for side.
+
+        Args:
+            side: "up" or "down"
+
+        Returns:
+            Tuple of (mid_price, spread), or (0.0, 0.0) if no book yet
+        """
+        token_id = self.token_ids.get(side)
+        return self._quotes.get(token_id, (0.0, 0.0)) if token_id else (0.0, 0.0)
+
     def _refresh_orders_sync(self) -> List[dict]:
         """Refresh open orders synchronously (called via to_thread)."""
         try:
@@ -171,6 +189,7 @@ class BaseStrategy(ABC):
         try:
             orders = await asyncio.to_thread(self._refresh_orders_sync)
             self._cached_orders = orders
+            self._mark_dirty()
         except Exception:
             pass
         finally:
@@ -197,9 +216,39 @@ class BaseStrategy(ABC):
         """
         if self._status_mode:
             self._log_buffer.add(msg, level)
+            self._mark_dirty()
         else:
             log(msg, level)
 
+    def _mark_dirty(self) -> None:
+        """Wake the main loop because strategy state changed."""
+        if self._update_event is not None:
+            self._update_event.set()
+
+    async def _wait_for_update(self) -> None:
+        """
+        Wait until strategy state changes.
+
+        Bursts of updates are coalesced into at most one loop iteration
+        per update_interval. When nothing changes, the loop still wakes
+        every idle_refresh_interval so the countdown keeps ticking.
+
+        The idle wake is a plain call_later timer that sets the event,
+        rather than asyncio.wait_for, which adds a wrapper task per wait on
+        Python <= 3.11.
+        """
+        await asyncio.sleep(self.config.update_interval)
+        event = self._update_event
+        if not event.is_set():
+            idle_wake = asyncio.get_running_loop().call_later(
+                self.config.idle_refresh_interval, event.set
+            )
+            try:
+                await event.wait()
+            finally:
+                idle_wake.cancel()
+        event.clear()
+
     async def start(self) -> bool:
         """
         Start the strategy.
@@ -208,23 +257,32 @@ class BaseStrategy(ABC):
             True if started successfully
         """
         self.running = True
+        # Created here so the event binds to the running loop
+        self._update_event = asyncio.Event()
 
         # Register callbacks on market manager
         @self.market.on_book_update
         async def handle_book(snapshot: OrderbookSnapshot):  # pyright: ignore[reportUnusedFunction]
-            # Record price
+            # Cache quote and record price
+            mid = snapshot.mid_price
+            best_bid = snapshot.best_bid
+            spread = snapshot.best_ask - best_bid if best_bid > 0 else 0.0
+            self._quotes[snapshot.asset_id] = (mid, spread)
+
             for side, token_id in self.token_ids.items():
                 if token_id == snapshot.asset_id:
-                    self.prices.record(side, snapshot.mid_price)
+                    self.prices.record(side, mid)
                     break
 
             # Delegate to subclass
             await self.on_book_update(snapshot)
+            self._mark_dirty()
 
         @self.market.on_market_change
         def handle_market_change(old_slug: str, new_slug: str):  # pyright: ignore[reportUnusedFunction]
             self.log(f"Market changed: {old_slug} -> {new_slug}", "warning")
             self.prices.clear()
+            self._quotes.clear()
             self.on_market_change(old_slug, new_slug)
 
         @self.market.on_connect
@@ -237,6 +295,13 @@ class BaseStrategy(ABC):
             self.log("WebSocket disconnected", "warning")
             self.on_disconnect()
 
+        @self.market.on_error
+        def handle_error(error: BaseException):  # pyright: ignore[reportUnusedFunction]
+            # A dead market task means no more data - stop right away
+            self.log(f"Market task failed: {error}", "error")
+            self.running = False
+            self._mark_dirty()
+
         # Start market manager
         if not await self.market.start():
             self.running = False
@@ -288,7 +353,7 @@ class BaseStrategy(ABC):
                 # Update display
                 self.render_status(prices)
 
-                await asyncio.sleep(self.config.update_interval)
+                await self._wait_for_update()
 
         except KeyboardInterrupt:
             self.log("Strategy stopped by user")
@@ -297,10 +362,10 @@ class BaseStrategy(ABC):
             self._print_summary()
 
     def _get_current_prices(self) -> Dict[str, float]:
-        """Get current prices from market manager."""
+        """Get current prices from cached quotes."""
         prices = {}
         for side in ["up", "down"]:
-            price = self.market.get_mid_price(side)
+            price = self.get_quote(side)[0]
             if price > 0:
                 prices[side] = price
         return prices
@@ -32,9 +32,10 @@ Arguments:
     --lookback      Detection window in seconds [default: 10]
     --take-profit   Take profit in dollars [default: 0.10]
     --stop-loss     Stop loss in dollars [default: 0.05]
+    --loop          Event loop backend (auto, uvloop, asyncio) [default: auto]
 
 Prerequisites:
-    - Python 3.8 or higher
+    - Python 3.9 or higher
     - All dependencies installed (see requirements.txt)
     - A .env file with POLY_PRIVATE_KEY and POLY_PROXY_WALLET
 
@@ -46,7 +47,6 @@ Risk Warning:
 
 import os
 import sys
-import asyncio
 import argparse
 import logging
 from pathlib import Path
@@ -63,9 +63,10 @@ load_dotenv()
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from lib.terminal_utils import Colors
-from src.bot import TradingBot
-from src.config import Config
-from apps.flash_crash_strategy import FlashCrashStrategy, FlashCrashConfig
+from lib.event_loop import LOOP_CHOICES, get_loop_factory, run_with_loop
+
+
+BANNER_SEPARATOR = f"{Colors.BOLD}{'='*60}{Colors.RESET}"
 
 
 def main():
@@ -116,8 +117,22 @@ def main():
         help="Enable debug logging"
     )
 
+    parser.add_argument(
+        "--loop",
+        type=str,
+        default="auto",
+        choices=LOOP_CHOICES,
+        help="Event loop backend (default: auto, uvloop when installed)"
+    )
+
     args = parser.parse_args()
 
+    # Select the event loop first so a missing uvloop fails before any setup
+    loop_factory = get_loop_factory(args.loop)
+    if loop_factory is None:
+        print(f"{Colors.RED}Error: uvloop is not installed{Colors.RESET}")
+        sys.exit(1)
+
     # Enable debug logging if requested
     if args.debug:
         logging.basicConfig(level=logging.DEBUG)
@@ -132,6 +147,12 @@ def main():
         print("Set them in .env file or export as environment variables")
         sys.exit(1)
 
+    # Deferred: these pull in eth_account/web3, which is only worth paying
+    # for once the environment checks have passed
+    from src.bot import TradingBot
+    from src.config import Config
+    from apps.flash_crash_strategy import FlashCrashStrategy, FlashCrashConfig
+
     # Create bot
     config = Config.from_env()
     bot = TradingBot(config=config, private_key=private_key)
@@ -150,25 +171,28 @@ def main():
         stop_loss=args.stop_loss,
     )
 
-    # Print configuration
-    print(f"\n{Colors.BOLD}{'='*60}{Colors.RESET}")
-    print(f"{Colors.BOLD}  Flash Crash Strategy - {strategy_config.coin} 15-Minute Markets{Colors.RESET}")
-    print(f"{Colors.BOLD}{'='*60}{Colors.RESET}\n")
-
-    print(f"Configuration:")
-    print(f"  Coin: {strategy_config.coin}")
-    print(f"  Size: ${strategy_config.size:.2f}")
-    print(f"  Drop threshold: {strategy_config.drop_threshold:.2f}")
-    print(f"  Lookback: {strategy_config.price_lookback_seconds}s")
-    print(f"  Take profit: +${strategy_config.take_profit:.2f}")
-    print(f"  Stop loss: -${strategy_config.stop_loss:.2f}")
-    print()
+    # Print configuration (one write for the whole block)
+    print("\n".join([
+        "",
+        BANNER_SEPARATOR,
+        f"{Colors.BOLD}  Flash Crash Strategy - {strategy_config.coin} 15-Minute Markets{Colors.RESET}",
+        BANNER_SEPARATOR,
+        "",
+        "Configuration:",
+        f"  Coin: {strategy_config.coin}",
+        f"  Size: ${strategy_config.size:.2f}",
+        f"  Drop threshold: {strategy_config.drop_threshold:.2f}",
+        f"  Lookback: {strategy_config.price_lookback_seconds}s",
+        f"  Take profit: +${strategy_config.take_profit:.2f}",
+        f"  Stop loss: -${strategy_config.stop_loss:.2f}",
+        "",
+    ]), flush=True)
 
     # Create and run strategy
     strategy = FlashCrashStrategy(bot=bot, config=strategy_config)
 
     try:
-        asyncio.run(strategy.run())
+        run_with_loop(strategy.run(), loop_factory)
     except KeyboardInterrupt:
         print("\nInterrupted")
     except Exception as e:
@@ -47,12 +47,30 @@ Risk Warning:
 from dataclasses import dataclass
 from typing import Dict
 
-from lib.terminal_utils import Colors, format_countdown
+from lib.terminal_utils import (
+    Colors,
+    DiffRenderer,
+    DIVIDER,
+    RULE,
+    MID_ROW,
+    format_countdown,
+    format_orderbook,
+)
 from apps.base_strategy import BaseStrategy, StrategyConfig
 from src.bot import TradingBot
 from src.websocket_client import OrderbookSnapshot
 
 
+# Static display lines (built once, reused every frame)
+WS_ONLINE = f"{Colors.GREEN}WS{Colors.RESET}"
+WS_OFFLINE = f"{Colors.RED}REST{Colors.RESET}"
+OPEN_ORDERS_HEADER = f"{Colors.BOLD}Open Orders:{Colors.RESET}"
+NO_ORDERS = f"  {Colors.CYAN}(no open orders){Colors.RESET}"
+POSITIONS_HEADER = f"{Colors.BOLD}Positions:{Colors.RESET}"
+NO_POSITIONS = f"  {Colors.CYAN}(no open positions){Colors.RESET}"
+EVENTS_HEADER = f"{Colors.BOLD}Recent Events:{Colors.RESET}"
+
+
 @dataclass
 class FlashCrashConfig(StrategyConfig):
     """Flash crash strategy configuration."""
@@ -76,6 +94,8 @@ class FlashCrashStrategy(BaseStrategy):
         # Update price tracker with our threshold
         self.prices.drop_threshold = config.drop_threshold
 
+        self._renderer = DiffRenderer()
+
     async def on_book_update(self, snapshot: OrderbookSnapshot) -> None:
         """Handle orderbook update - check for flash crashes."""
         pass  # Price recording is done in base class
@@ -102,50 +122,29 @@ class FlashCrashStrategy(BaseStrategy):
         lines = []
 
         # Header
-        ws_status = f"{Colors.GREEN}WS{Colors.RESET}" if self.is_connected else f"{Colors.RED}REST{Colors.RESET}"
+        ws_status = WS_ONLINE if self.is_connected else WS_OFFLINE
         countdown = self._get_countdown_str()
         stats = self.positions.get_stats()
 
-        lines.append(f"{Colors.BOLD}{'='*80}{Colors.RESET}")
+        lines.append(DIVIDER)
         lines.append(
             f"{Colors.CYAN}[{self.config.coin}]{Colors.RESET} [{ws_status}] "
             f"Ends: {countdown} | Trades: {stats['trades_closed']} | PnL: ${stats['total_pnl']:+.2f}"
         )
-        lines.append(f"{Colors.BOLD}{'='*80}{Colors.RESET}")
-
-        # Orderbook display
-        up_ob = self.market.get_orderbook("up")
-        down_ob = self.market.get_orderbook("down")
-
-        lines.append(f"{Colors.GREEN}{'UP':^39}{Colors.RESET}|{Colors.RED}{'DOWN':^39}{Colors.RESET}")
-        lines.append(f"{'Bid':>9} {'Size':>9} | {'Ask':>9} {'Size':>9}|{'Bid':>9} {'Size':>9} | {'Ask':>9} {'Size':>9}")
-        lines.append("-" * 80)
-
-        # Get 5 levels
-        up_bids = up_ob.bids[:5] if up_ob else []
-        up_asks = up_ob.asks[:5] if up_ob else []
-        down_bids = down_ob.bids[:5] if down_ob else []
-        down_asks = down_ob.asks[:5] if down_ob else []
+        lines.append(DIVIDER)
 
-        for i in range(5):
-            up_bid = f"{up_bids[i].price:>9.4f} {up_bids[i].size:>9.1f}" if i < len(up_bids) else f"{'--':>9} {'--':>9}"
-            up_ask = f"{up_asks[i].price:>9.4f} {up_asks[i].size:>9.1f}" if i < len(up_asks) else f"{'--':>9} {'--':>9}"
-            down_bid = f"{down_bids[i].price:>9.4f} {down_bids[i].size:>9.1f}" if i < len(down_bids) else f"{'--':>9} {'--':>9}"
-            down_ask = f"{down_asks[i].price:>9.4f} {down_asks[i].size:>9.1f}" if i < len(down_asks) else f"{'--':>9} {'--':>9}"
-            lines.append(f"{up_bid} | {up_ask}|{down_bid} | {down_ask}")
-
-        lines.append("-" * 80)
+        # Orderbook display (5 levels)
+        lines.extend(format_orderbook(
+            self.market.get_orderbook("up"),
+            self.market.get_orderbook("down"),
+            depth=5,
+        ))
 
         # Summary
-        up_mid = up_ob.mid_price if up_ob else prices.get("up", 0)
-        down_mid = down_ob.mid_price if down_ob else prices.get("down", 0)
-        up_spread = self.market.get_spread("up")
-        down_spread = self.market.get_spread("down")
+        up_mid, up_spread = self.get_quote("up")
+        down_mid, down_spread = self.get_quote("down")
 
-        lines.append(
-            f"Mid: {Colors.GREEN}{up_mid:.4f}{Colors.RESET}  Spread: {up_spread:.4f}           |"
-            f"Mid: {Colors.RED}{down_mid:.4f}{Colors.RESET}  Spread: {down_spread:.4f}"
-        )
+        lines.append(MID_ROW(up_mid, up_spread, down_mid, down_spread))
 
         # History info
         up_history = self.prices.get_history_count("up")
@@ -155,10 +154,10 @@ class FlashCrashStrategy(BaseStrategy):
             f"Drop threshold: {self.flash_config.drop_threshold:.2f} in {self.config.price_lookback_seconds}s"
         )
 
-        lines.append(f"{Colors.BOLD}{'='*80}{Colors.RESET}")
+        lines.append(DIVIDER)
 
         # Open Orders section
-        lines.append(f"{Colors.BOLD}Open Orders:{Colors.RESET}")
+        lines.append(OPEN_ORDERS_HEADER)
         if self.open_orders:
             for order in self.open_orders[:5]:  # Show max 5 orders
                 side = order.get("side", "?")
@@ -172,10 +171,10 @@ class FlashCrashStrategy(BaseStrategy):
                 color = Colors.GREEN if side == "BUY" else Colors.RED
                 lines.append(f"  {color}{side:4}{Colors.RESET} {token_side:4} @ {price:.4f} Size: {size:.1f} Filled: {filled:.1f} ID: {order_id}...")
         else:
-            lines.append(f"  {Colors.CYAN}(no open orders){Colors.RESET}")
+            lines.append(NO_ORDERS)
 
         # Positions
-        lines.append(f"{Colors.BOLD}Positions:{Colors.RESET}")
+        lines.append(POSITIONS_HEADER)
         all_positions = self.positions.get_all_positions()
         if all_positions:
             for pos in all_positions:
@@ -196,18 +195,17 @@ class FlashCrashStrategy(BaseStrategy):
                     f"SL: {pos.stop_loss_price:.4f} (-${self.config.stop_loss:.2f})"
                 )
         else:
-            lines.append(f"  {Colors.CYAN}(no open positions){Colors.RESET}")
+            lines.append(NO_POSITIONS)
 
         # Recent logs
         if self._log_buffer.messages:
-            lines.append("-" * 80)
-            lines.append(f"{Colors.BOLD}Recent Events:{Colors.RESET}")
+            lines.append(RULE)
+            lines.append(EVENTS_HEADER)
             for msg in self._log_buffer.get_messages():
                 lines.append(f"  {msg}")
 
-        # Render
-        output = "\033[H\033[J" + "\n".join(lines)
-        print(output, flush=True)
+        # Render (only changed lines are rewritten)
+        self._renderer.render(lines)
 
     def _get_countdown_str(self) -> str:
         """Get formatted countdown string."""
@@ -219,6 +217,15 @@ class FlashCrashStrategy(BaseStrategy):
         return format_countdown(mins, secs)
 
     def on_market_change(self, old_slug: str, new_slug: str) -> None:
-        """Handle market change - clear price history."""
+        """Handle market change - clear price history and redraw."""
         self.prices.clear()
+        self._renderer.reset()
+
+    def on_connect(self) -> None:
+        """Redraw the full screen after (re)connect log output."""
+        self._renderer.reset()
+
+    def on_disconnect(self) -> None:
+        """Redraw the full screen after disconnect log output."""
+        self._renderer.reset()
 
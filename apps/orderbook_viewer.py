@@ -28,9 +28,10 @@ Usage:
 Arguments:
     --coin      Coin symbol (BTC, ETH, SOL, XRP) [default: ETH]
     --levels    Number of price levels to display [default: 5]
+    --loop      Event loop backend (auto, uvloop, asyncio) [default: auto]
 
 Prerequisites:
-    - Python 3.8 or higher
+    - Python 3.9 or higher
     - All dependencies installed (see requirements.txt)
     - Terminal that supports ANSI color codes (most modern terminals)
 
@@ -57,7 +58,14 @@ load_dotenv()
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from lib import MarketManager, PriceTracker, Colors
-from lib.terminal_utils import format_countdown
+from lib.event_loop import LOOP_CHOICES, get_loop_factory, run_with_loop
+from lib.terminal_utils import (
+    DiffRenderer,
+    DIVIDER,
+    MID_ROW,
+    format_countdown,
+    format_orderbook,
+)
 
 
 class OrderbookTUI:
@@ -69,6 +77,7 @@ class OrderbookTUI:
         self.market = MarketManager(coin=self.coin)
         self.prices = PriceTracker()
         self.running = False
+        self._renderer = DiffRenderer()
 
     async def run(self) -> None:
         """Run the TUI."""
@@ -84,11 +93,15 @@ class OrderbookTUI:
 
         @self.market.on_connect
         def on_connect():  # pyright: ignore[reportUnusedFunction]
-            pass
+            self._renderer.reset()
 
         @self.market.on_disconnect
         def on_disconnect():  # pyright: ignore[reportUnusedFunction]
-            pass
+            self._renderer.reset()
+
+        @self.market.on_market_change
+        def on_market_change(old_slug: str, new_slug: str):  # pyright: ignore[reportUnusedFunction]
+            self._renderer.reset()
 
         # Start market manager
         if not await self.market.start():
@@ -118,9 +131,9 @@ class OrderbookTUI:
             mins, secs = market.get_countdown()
             countdown = format_countdown(mins, secs)
 
-        lines.append(f"{Colors.BOLD}{'='*80}{Colors.RESET}")
+        lines.append(DIVIDER)
         lines.append(f"{Colors.CYAN}Orderbook TUI{Colors.RESET} | {self.coin} | {ws_status} | Ends: {countdown}")
-        lines.append(f"{Colors.BOLD}{'='*80}{Colors.RESET}")
+        lines.append(DIVIDER)
 
         # Market info
         if market:
@@ -132,24 +145,8 @@ class OrderbookTUI:
         up_ob = self.market.get_orderbook("up")
         down_ob = self.market.get_orderbook("down")
 
-        lines.append(f"{Colors.GREEN}{'UP':^39}{Colors.RESET}|{Colors.RED}{'DOWN':^39}{Colors.RESET}")
-        lines.append(f"{'Bid':>9} {'Size':>9} | {'Ask':>9} {'Size':>9}|{'Bid':>9} {'Size':>9} | {'Ask':>9} {'Size':>9}")
-        lines.append("-" * 80)
-
         # Get 10 levels for TUI
-        up_bids = up_ob.bids[:10] if up_ob else []
-        up_asks = up_ob.asks[:10] if up_ob else []
-        down_bids = down_ob.bids[:10] if down_ob else []
-        down_asks = down_ob.asks[:10] if down_ob else []
-
-        for i in range(10):
-            up_bid = f"{up_bids[i].price:>9.4f} {up_bids[i].size:>9.1f}" if i < len(up_bids) else f"{'--':>9} {'--':>9}"
-            up_ask = f"{up_asks[i].price:>9.4f} {up_asks[i].size:>9.1f}" if i < len(up_asks) else f"{'--':>9} {'--':>9}"
-            down_bid = f"{down_bids[i].price:>9.4f} {down_bids[i].size:>9.1f}" if i < len(down_bids) else f"{'--':>9} {'--':>9}"
-            down_ask = f"{down_asks[i].price:>9.4f} {down_asks[i].size:>9.1f}" if i < len(down_asks) else f"{'--':>9} {'--':>9}"
-            lines.append(f"{up_bid} | {up_ask}|{down_bid} | {down_ask}")
-
-        lines.append("-" * 80)
+        lines.extend(format_orderbook(up_ob, down_ob, depth=10))
 
         # Summary
         up_mid = up_ob.mid_price if up_ob else 0
@@ -157,10 +154,7 @@ class OrderbookTUI:
         up_spread = self.market.get_spread("up")
         down_spread = self.market.get_spread("down")
 
-        lines.append(
-            f"Mid: {Colors.GREEN}{up_mid:.4f}{Colors.RESET}  Spread: {up_spread:.4f}           |"
-            f"Mid: {Colors.RED}{down_mid:.4f}{Colors.RESET}  Spread: {down_spread:.4f}"
-        )
+        lines.append(MID_ROW(up_mid, up_spread, down_mid, down_spread))
 
         # Price history stats
         up_history = self.prices.get_history_count("up")
@@ -172,12 +166,11 @@ class OrderbookTUI:
         lines.append("")
         lines.append(f"History: UP={up_history} DOWN={down_history} | 60s Volatility: UP={up_vol:.4f} DOWN={down_vol:.4f}")
 
-        lines.append(f"{Colors.BOLD}{'='*80}{Colors.RESET}")
+        lines.append(DIVIDER)
         lines.append(f"{Colors.DIM}Press Ctrl+C to exit{Colors.RESET}")
 
-        # Render
-        output = "\033[H\033[J" + "\n".join(lines)
-        print(output, flush=True)
+        # Render (only changed lines are rewritten)
+        self._renderer.render(lines)
 
 
 def main():
@@ -193,12 +186,26 @@ def main():
         help="Coin to monitor (default: ETH)"
     )
 
+    parser.add_argument(
+        "--loop",
+        type=str,
+        default="auto",
+        choices=LOOP_CHOICES,
+        help="Event loop backend (default: auto, uvloop when installed)"
+    )
+
     args = parser.parse_args()
 
+    # Select the event loop first so a missing uvloop fails before any setup
+    loop_factory = get_loop_factory(args.loop)
+    if loop_factory is None:
+        print(f"{Colors.RED}Error: uvloop is not installed{Colors.RESET}")
+        sys.exit(1)
+
     tui = OrderbookTUI(coin=args.coin)
 
     try:
-        asyncio.run(tui.run())
+        run_with_loop(tui.run(), loop_factory)
     except KeyboardInterrupt:
         print("\nExiting...")
 
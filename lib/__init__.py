@@ -10,6 +10,7 @@ Available Modules:
     - market_manager: Market discovery and WebSocket connection management
     - price_tracker: Real-time price history tracking and pattern detection
     - position_manager: Position tracking with take-profit and stop-loss management
+    - event_loop: Event loop backend selection (uvloop loop factory with asyncio fallback)
 
 Usage:
     from lib import MarketManager, PriceTracker, PositionManager
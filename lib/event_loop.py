@@ -0,0 +1,108 @@
+"""
+Event Loop - asyncio Backend Selection
+
+Provides:
+- The --loop choices shared by the app runners
+- uvloop loop factory selection with a stock asyncio fallback
+- Running a coroutine on a loop from a factory (no global policy)
+
+Usage:
+    from lib.event_loop import LOOP_CHOICES, get_loop_factory, run_with_loop
+
+    parser.add_argument("--loop", default="auto", choices=LOOP_CHOICES)
+    args = parser.parse_args()
+
+    loop_factory = get_loop_factory(args.loop)
+    if loop_factory is None:
+        sys.exit("uvloop is not installed")
+
+    run_with_loop(main(), loop_factory)
+"""
+
+import asyncio
+import sys
+from typing import Any, Callable, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+LoopFactory = Callable[[], asyncio.AbstractEventLoop]
+
+# Accepted values for the runners' --loop flag
+LOOP_CHOICES = ("auto", "uvloop", "asyncio")
+
+
+def get_loop_factory(choice: str = "auto") -> Optional[LoopFactory]:
+    """
+    Pick the event loop factory for a --loop choice.
+
+    Args:
+        choice: "auto" (uvloop when installed), "uvloop" (required),
+            or "asyncio" (stock loop)
+
+    Returns:
+        A loop factory, or None if uvloop was required but is not installed
+    """
+    if choice == "asyncio":
+        return asyncio.new_event_loop
+
+    try:
+        import uvloop
+    except ImportError:
+        return None if choice == "uvloop" else asyncio.new_event_loop
+
+    return uvloop.new_event_loop
+
+
+def run_with_loop(main: Coroutine[Any, Any, T], loop_factory: LoopFactory) -> T:
+    """
+    Run a coroutine to completion on a new loop from loop_factory.
+
+    Equivalent to asyncio.run(main, loop_factory=...) without installing a
+    global event loop policy. Uses asyncio.Runner on Python 3.11+ and the
+    same setup/teardown by hand on older versions.
+
+    Args:
+        main: Coroutine to run
+        loop_factory: Callable returning a new event loop
+
+    Returns:
+        The coroutine's result
+    """
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(main)
+
+    loop = loop_factory()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            _cancel_all_tasks(loop)
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+
+def _cancel_all_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    """Cancel tasks left on the loop and wait for them (as asyncio.run does)."""
+    pending = asyncio.all_tasks(loop)
+    if not pending:
+        return
+
+    for task in pending:
+        task.cancel()
+
+    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
+    for task in pending:
+        if task.cancelled():
+            continue
+        if task.exception() is not None:
+            loop.call_exception_handler({
+                "message": "unhandled exception during shutdown",
+                "exception": task.exception(),
+                "task": task,
+            })
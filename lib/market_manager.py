@@ -31,6 +31,7 @@ Usage:
 """
 
 import asyncio
+import logging
 import time
 from datetime import datetime, timezone
 from dataclasses import dataclass
@@ -40,6 +41,9 @@ from src.gamma_client import GammaClient
 from src.websocket_client import MarketWebSocket, OrderbookSnapshot
 
 
+logger = logging.getLogger(__name__)
+
+
 @dataclass
 class MarketInfo:
     """Current market information."""
@@ -133,6 +137,7 @@ class MarketInfo:
 BookCallback = Callable[[OrderbookSnapshot], Union[None, Awaitable[None]]]
 MarketChangeCallback = Callable[[str, str], None]  # (old_slug, new_slug)
 ConnectionCallback = Callable[[], None]
+ErrorCallback = Callable[[BaseException], None]
 
 
 class MarketManager:
@@ -144,6 +149,7 @@ class MarketManager:
     - WebSocket connection with auto-reconnect
     - Market change detection and notification
     - Orderbook caching
+    - Failure notification for background tasks
     """
 
     def __init__(
@@ -181,6 +187,7 @@ class MarketManager:
         self._on_market_change_callbacks: List[MarketChangeCallback] = []
         self._on_connect_callbacks: List[ConnectionCallback] = []
         self._on_disconnect_callbacks: List[ConnectionCallback] = []
+        self._on_error_callbacks: List[ErrorCallback] = []
 
     @property
     def is_connected(self) -> bool:
@@ -259,6 +266,33 @@ class MarketManager:
         self._on_disconnect_callbacks.append(callback)
         return callback
 
+    def on_error(self, callback: ErrorCallback) -> ErrorCallback:
+        """Register callback for background task failures."""
+        self._on_error_callbacks.append(callback)
+        return callback
+
+    def _watch_task(self, task: asyncio.Task) -> asyncio.Task:
+        """Report the task's failure to error callbacks as soon as it finishes."""
+        task.add_done_callback(self._handle_task_done)
+        return task
+
+    def _handle_task_done(self, task: asyncio.Task) -> None:
+        """Done callback for background tasks: log failures, then notify."""
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is None:
+            return
+        logger.error(
+            f"Background task {task.get_name()} failed: {error}",
+            exc_info=error,
+        )
+        for callback in self._on_error_callbacks:
+            try:
+                callback(error)
+            except Exception:
+                logger.exception("Error in market manager on_error callback")
+
     def _update_current_market(self, market: MarketInfo) -> None:
         """Update current market state."""
         self._previous_slug = market.slug
@@ -418,8 +452,9 @@ class MarketManager:
         """
         self._running = True
 
-        # Discover initial market
-        if not self.discover_market():
+        # Discover initial market (HTTP call runs in thread pool so the
+        # event loop keeps servicing other tasks meanwhile)
+        if not await asyncio.to_thread(self.discover_market):
             self._running = False
             return False
 
@@ -429,11 +464,15 @@ class MarketManager:
             return False
 
         # Start WebSocket in background
-        self._ws_task = asyncio.create_task(self._run_websocket())
+        self._ws_task = self._watch_task(
+            asyncio.create_task(self._run_websocket(), name="market-websocket")
+        )
 
         # Start market check loop
         if self.auto_switch_market:
-            self._market_check_task = asyncio.create_task(self._market_check_loop())
+            self._market_check_task = self._watch_task(
+                asyncio.create_task(self._market_check_loop(), name="market-check")
+            )
 
         return True
 
@@ -447,6 +486,8 @@ class MarketManager:
                 await self._market_check_task
             except asyncio.CancelledError:
                 pass
+            except Exception:
+                pass  # Already logged by _handle_task_done
             self._market_check_task = None
 
         if self._ws_task:
@@ -455,6 +496,8 @@ class MarketManager:
                 await self._ws_task
             except asyncio.CancelledError:
                 pass
+            except Exception:
+                pass  # Already logged by _handle_task_done
             self._ws_task = None
 
         if self.ws:
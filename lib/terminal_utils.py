@@ -5,6 +5,8 @@ Provides:
 - ANSI color codes
 - Colored print functions
 - In-place terminal updates
+- Diff-based in-place rendering
+- Shared orderbook table formatting
 - Log formatting
 
 Usage:
@@ -14,9 +16,17 @@ Usage:
     print(f"{Colors.GREEN}Connected{Colors.RESET}")
 """
 
+import os
+import signal
+import sys
+import time
 from datetime import datetime
 from collections import deque
 from dataclasses import dataclass, field
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.websocket_client import OrderbookSnapshot
 
 
 class Colors:
@@ -58,6 +68,15 @@ LOG_SYMBOLS = {
     "debug": ("·", Colors.DIM),
 }
 
+# Pre-built "symbol " prefixes per level and timestamp wrapper pieces
+LOG_PREFIXES = {
+    level: f"{color}{symbol}{Colors.RESET} "
+    for level, (symbol, color) in LOG_SYMBOLS.items()
+}
+DEFAULT_LOG_PREFIX = f"·{Colors.RESET} "
+TIMESTAMP_OPEN = f"{Colors.CYAN}["
+TIMESTAMP_CLOSE = f"]{Colors.RESET} "
+
 
 def get_timestamp() -> str:
     """Get current timestamp string."""
@@ -93,12 +112,11 @@ def format_log(msg: str, level: str = "info", show_timestamp: bool = True) -> st
     Returns:
         Formatted message string
     """
-    symbol, color = LOG_SYMBOLS.get(level, ("·", ""))
-    ts = get_timestamp()
+    prefix = LOG_PREFIXES.get(level, DEFAULT_LOG_PREFIX)
 
     if show_timestamp:
-        return f"{Colors.CYAN}[{ts}]{Colors.RESET} {color}{symbol}{Colors.RESET} {msg}"
-    return f"{color}{symbol}{Colors.RESET} {msg}"
+        return f"{TIMESTAMP_OPEN}{get_timestamp()}{TIMESTAMP_CLOSE}{prefix}{msg}"
+    return prefix + msg
 
 
 def clear_screen() -> None:
@@ -140,6 +158,62 @@ def format_pnl(pnl: float, include_sign: bool = True) -> str:
     return f"{color}${abs(pnl):.2f}{Colors.RESET}"
 
 
+# Static 80-column TUI pieces shared by the strategy and orderbook viewer
+DIVIDER = f"{Colors.BOLD}{'='*80}{Colors.RESET}"
+RULE = "-" * 80
+BOOK_TITLE = f"{Colors.GREEN}{'UP':^39}{Colors.RESET}|{Colors.RED}{'DOWN':^39}{Colors.RESET}"
+BOOK_COLUMNS = f"{'Bid':>9} {'Size':>9} | {'Ask':>9} {'Size':>9}|{'Bid':>9} {'Size':>9} | {'Ask':>9} {'Size':>9}"
+EMPTY_LEVEL = f"{'--':>9} {'--':>9}"
+
+# Row templates (format specs parsed once)
+LEVEL_ROW = "{:>9.4f} {:>9.1f}".format
+BOOK_ROW = "{} | {}|{} | {}".format
+MID_ROW = (
+    f"Mid: {Colors.GREEN}{{:.4f}}{Colors.RESET}  Spread: {{:.4f}}           |"
+    f"Mid: {Colors.RED}{{:.4f}}{Colors.RESET}  Spread: {{:.4f}}"
+).format
+
+
+def format_level(levels: list, i: int) -> str:
+    """Format orderbook level i as 'price size', or dashes if missing."""
+    if i < len(levels):
+        return LEVEL_ROW(levels[i].price, levels[i].size)
+    return EMPTY_LEVEL
+
+
+def format_orderbook(
+    up_ob: Optional["OrderbookSnapshot"],
+    down_ob: Optional["OrderbookSnapshot"],
+    depth: int = 5,
+) -> list[str]:
+    """
+    Format UP and DOWN orderbooks side by side.
+
+    Args:
+        up_ob: UP token orderbook (or None)
+        down_ob: DOWN token orderbook (or None)
+        depth: Number of price levels per side
+
+    Returns:
+        Title, column header, rule, one row per level, closing rule
+    """
+    up_bids = up_ob.bids[:depth] if up_ob else []
+    up_asks = up_ob.asks[:depth] if up_ob else []
+    down_bids = down_ob.bids[:depth] if down_ob else []
+    down_asks = down_ob.asks[:depth] if down_ob else []
+
+    lines = [BOOK_TITLE, BOOK_COLUMNS, RULE]
+    for i in range(depth):
+        lines.append(BOOK_ROW(
+            format_level(up_bids, i),
+            format_level(up_asks, i),
+            format_level(down_bids, i),
+            format_level(down_asks, i),
+        ))
+    lines.append(RULE)
+    return lines
+
+
 def format_countdown(minutes: int, seconds: int) -> str:
     """
     Format countdown with color based on time remaining.
@@ -196,6 +270,120 @@ class LogBuffer:
         self.messages.clear()
 
 
+def write_frame(frame: str) -> None:
+    """
+    Write a pre-assembled frame to stdout in a single os.write().
+
+    Bypasses print() and the TextIOWrapper so a frame costs one syscall.
+    Falls back to sys.stdout.write() on Windows consoles or when stdout
+    has no real file descriptor (e.g. captured output).
+
+    Args:
+        frame: Complete frame text including escape sequences
+    """
+    stream = sys.stdout
+    try:
+        fd = stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        fd = None
+
+    if fd is None or os.name == "nt":
+        stream.write(frame)
+        stream.flush()
+        return
+
+    # Flush pending print() output first so ordering is preserved
+    stream.flush()
+    encoding = getattr(stream, "encoding", None) or "utf-8"
+    data = memoryview(frame.encode(encoding, errors="replace"))
+    while data:
+        written = os.write(fd, data)
+        data = data[written:]
+
+
+class DiffRenderer:
+    """
+    In-place renderer that only rewrites lines that changed.
+
+    Keeps the previous frame and, for each changed line, moves the cursor
+    to that row and erases it before writing, instead of clearing the
+    whole screen every frame.
+
+    Output written outside the frame (e.g. log lines on stderr) or a
+    terminal resize shifts rows the renderer believes are unchanged, so
+    the whole screen is redrawn every full_redraw_interval seconds, after
+    a terminal resize (SIGWINCH, where available), and after reset().
+
+    Usage:
+        renderer = DiffRenderer()
+        renderer.render(["line 1", "line 2"])
+        renderer.render(["line 1", "line 2 changed"])  # rewrites row 2 only
+    """
+
+    def __init__(self, full_redraw_interval: float = 5.0):
+        self.full_redraw_interval = full_redraw_interval
+        self._prev: list[str] = []
+        self._last_full_redraw = 0.0
+        self._resized = False
+        self._install_resize_handler()
+
+    def _install_resize_handler(self) -> None:
+        """Flag a full redraw on SIGWINCH, chaining any previous handler."""
+        sigwinch = getattr(signal, "SIGWINCH", None)
+        if sigwinch is None:
+            return
+
+        previous = signal.getsignal(sigwinch)
+
+        def on_resize(signum, frame):
+            self._resized = True
+            if callable(previous):
+                previous(signum, frame)
+
+        try:
+            signal.signal(sigwinch, on_resize)
+        except ValueError:
+            pass  # Not the main thread; rely on the periodic redraw
+
+    def render(self, lines: list[str]) -> None:
+        """
+        Render lines, writing only rows that differ from the last frame.
+
+        Args:
+            lines: Full list of lines for the new frame
+        """
+        now = time.monotonic()
+        if self._resized or now - self._last_full_redraw >= self.full_redraw_interval:
+            self._prev = []
+            self._resized = False
+
+        prev = self._prev
+        if prev:
+            parts = []
+        else:
+            parts = ["\033[H\033[J"]
+            self._last_full_redraw = now
+
+        for i, line in enumerate(lines):
+            if i >= len(prev) or prev[i] != line:
+                parts.append(f"\033[{i + 1};1H\033[K{line}")
+
+        # Erase rows left over from a longer previous frame
+        if len(lines) < len(prev):
+            parts.append(f"\033[{len(lines) + 1};1H\033[J")
+
+        if parts:
+            # Leave the cursor below the frame
+            parts.append(f"\033[{len(lines) + 1};1H")
+            write_frame("".join(parts))
+
+        self._prev = list(lines)
+
+    def reset(self) -> None:
+        """Forget the previous frame so the next render redraws everything."""
+        self._prev = []
+
+
 class StatusDisplay:
     """
     Helper for building multi-line status displays.
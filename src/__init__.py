@@ -35,24 +35,69 @@ Core Modules:
     utils.py          - Helper functions and utilities
 """
 
-# Core classes
-from .bot import TradingBot, OrderResult
-from .signer import OrderSigner, Order
-from .client import ApiClient, ClobClient, RelayerClient
-from .crypto import KeyManager
-from .config import Config, BuilderConfig
-from .gamma_client import GammaClient
-from .websocket_client import MarketWebSocket, OrderbookManager, OrderbookSnapshot
-
-# Utility functions
-from .utils import (
-    create_bot_from_env,
-    validate_address,
-    validate_private_key,
-    format_price,
-    format_usdc,
-    truncate_address,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+# Public name -> defining submodule. Resolved on first attribute access so
+# importing one submodule (e.g. src.gamma_client) does not pull in
+# eth_account/web3 through src.bot and src.signer.
+_LAZY_EXPORTS = {
+    # Core classes
+    "TradingBot": ".bot",
+    "OrderResult": ".bot",
+    "OrderSigner": ".signer",
+    "Order": ".signer",
+    "ApiClient": ".client",
+    "ClobClient": ".client",
+    "RelayerClient": ".client",
+    "KeyManager": ".crypto",
+    "Config": ".config",
+    "BuilderConfig": ".config",
+    "GammaClient": ".gamma_client",
+    "MarketWebSocket": ".websocket_client",
+    "OrderbookManager": ".websocket_client",
+    "OrderbookSnapshot": ".websocket_client",
+    # Utility functions
+    "create_bot_from_env": ".utils",
+    "validate_address": ".utils",
+    "validate_private_key": ".utils",
+    "format_price": ".utils",
+    "format_usdc": ".utils",
+    "truncate_address": ".utils",
+}
+
+if TYPE_CHECKING:
+    from .bot import TradingBot, OrderResult
+    from .signer import OrderSigner, Order
+    from .client import ApiClient, ClobClient, RelayerClient
+    from .crypto import KeyManager
+    from .config import Config, BuilderConfig
+    from .gamma_client import GammaClient
+    from .websocket_client import MarketWebSocket, OrderbookManager, OrderbookSnapshot
+    from .utils import (
+        create_bot_from_env,
+        validate_address,
+        validate_private_key,
+        format_price,
+        format_usdc,
+        truncate_address,
+    )
+
+
+def __getattr__(name: str):
+    """Import public names from their submodule on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily exported names in dir(src)."""
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __version__ = "1.0.0"
 __author__ = "Polymarket Arbitrage Bot Contributors"
@@ -37,6 +37,12 @@ from typing import Dict, Any, List
 from dataclasses import dataclass, field, asdict
 import yaml
 
+try:
+    # libyaml C bindings (roughly 10x faster than the pure-Python parser)
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
 
 # Environment variable prefix
 ENV_PREFIX = "POLY_"
@@ -187,8 +193,7 @@ class Config:
         if not path.exists():
             raise ConfigNotFoundError(f"Config file not found: {filepath}")
 
-        with open(path, 'r') as f:
-            data = yaml.safe_load(f) or {}
+        data = yaml.load(path.read_text(), Loader=YamlLoader) or {}
 
         return cls.from_dict(data)
 
@@ -383,8 +388,9 @@ class Config:
         path = Path(filepath)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, 'w') as f:
-            yaml.dump(data, f, default_flow_style=False, indent=2)
+        path.write_text(yaml.dump(
+            data, Dumper=YamlDumper, default_flow_style=False, indent=2
+        ))
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary."""
@@ -41,6 +41,7 @@ Security Best Practices:
 """
 
 import os
+import re
 import json
 import base64
 import secrets
@@ -52,6 +53,10 @@ from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.backends import default_backend
 
 
+# 32-byte private key as lowercase hex (without 0x prefix)
+PRIVATE_KEY_RE = re.compile(r"[0-9a-f]{64}")
+
+
 class CryptoError(Exception):
     """Base exception for crypto operations."""
     pass
@@ -127,10 +132,8 @@ class KeyManager:
         if key.startswith("0x"):
             key = key[2:]
 
-        # Validate hex format
-        try:
-            int(key, 16)
-        except ValueError:
+        # Validate format (same rule as verify_private_key)
+        if PRIVATE_KEY_RE.fullmatch(key) is None:
             raise ValueError("Invalid private key format")
 
         # Create Fernet cipher
@@ -261,9 +264,7 @@ def verify_private_key(private_key: str) -> Tuple[bool, str]:
         return False, "Key must be 64 hex characters"
 
     # Check valid hex
-    try:
-        int(key, 16)
-    except ValueError:
+    if PRIVATE_KEY_RE.fullmatch(key) is None:
         return False, "Key contains invalid characters"
 
     return True, f"0x{key}"
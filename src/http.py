@@ -8,9 +8,14 @@ environments.
 
 Thread Safety:
     Each thread gets its own requests.Session instance, ensuring that
-    connection pools, cookies, and session state are properly isolated.
-    This prevents potential race conditions and connection reuse issues
-    when making concurrent HTTP requests.
+    cookies and session state are properly isolated. This prevents
+    potential race conditions when making concurrent HTTP requests.
+
+Connection Reuse:
+    All thread-local sessions of one client mount the same HTTPAdapter,
+    whose urllib3 connection pool is thread-safe. Keep-alive TCP/TLS
+    connections opened by one worker thread (e.g. asyncio.to_thread) are
+    reused by the others instead of handshaking again per thread.
 
 Usage:
     from src.http import ThreadLocalSessionMixin
@@ -32,17 +37,28 @@ import threading
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+
+
+# Connection pool sizing for the shared adapter
+POOL_CONNECTIONS = 4   # Distinct hosts kept pooled
+POOL_MAXSIZE = 32      # Keep-alive connections per host (>= worker threads)
 
 
 class ThreadLocalSessionMixin:
     """
     Mixin providing a thread-local requests.Session.
 
-    Each thread gets its own Session instance to keep connections isolated.
+    Each thread gets its own Session instance to keep session state isolated,
+    while all sessions share one HTTPAdapter so pooled connections are reused.
     """
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self._session_local = threading.local()
+        self._http_adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+        )
         super().__init__(*args, **kwargs)
 
     def _get_session(self) -> requests.Session:
@@ -50,6 +66,8 @@ class ThreadLocalSessionMixin:
         session = getattr(self._session_local, "session", None)
         if session is None:
             session = requests.Session()
+            session.mount("https://", self._http_adapter)
+            session.mount("http://", self._http_adapter)
             self._session_local.session = session
         return session
 
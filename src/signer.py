@@ -17,6 +17,7 @@ Features:
     - Typed data structure definitions
     - Signature verification utilities
     - Support for all Polymarket order types
+    - Order domain separator and type hash computed once
 
 Example:
     from src.signer import OrderSigner, Order
@@ -43,16 +44,73 @@ Security Note:
 """
 
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
+from eth_abi import encode as abi_encode
 from eth_account import Account
-from eth_account.messages import encode_typed_data
-from eth_utils import to_checksum_address
+from eth_account.messages import SignableMessage, encode_typed_data
+from eth_utils import keccak, to_checksum_address
 
 
 # USDC has 6 decimal places
 USDC_DECIMALS = 6
 
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+# EIP712Domain fields in canonical order (only those present are encoded)
+EIP712_DOMAIN_FIELDS = [
+    {"name": "name", "type": "string"},
+    {"name": "version", "type": "string"},
+    {"name": "chainId", "type": "uint256"},
+    {"name": "verifyingContract", "type": "address"},
+    {"name": "salt", "type": "bytes32"},
+]
+
+
+def _type_hash(primary_type: str, fields: List[Dict[str, str]]) -> bytes:
+    """Compute the EIP-712 typeHash for a struct without nested types."""
+    members = ",".join(f"{f['type']} {f['name']}" for f in fields)
+    return keccak(text=f"{primary_type}({members})")
+
+
+def _hash_struct(
+    primary_type: str,
+    fields: List[Dict[str, str]],
+    data: Dict[str, Any]
+) -> bytes:
+    """
+    Compute the EIP-712 hashStruct of a flat struct (no arrays or nested types).
+
+    Args:
+        primary_type: Struct name
+        fields: Field definitions in declaration order
+        data: Field values keyed by field name
+
+    Returns:
+        32-byte struct hash
+    """
+    abi_types = ["bytes32"]
+    values: List[Any] = [_type_hash(primary_type, fields)]
+    for f in fields:
+        value = data[f["name"]]
+        if f["type"] == "string":
+            abi_types.append("bytes32")
+            values.append(keccak(text=value))
+        elif f["type"] == "bytes":
+            abi_types.append("bytes32")
+            values.append(keccak(value))
+        else:
+            abi_types.append(f["type"])
+            values.append(value)
+    return keccak(abi_encode(abi_types, values))
+
+
+def _domain_separator(domain: Dict[str, Any]) -> bytes:
+    """Compute the EIP-712 domain separator from the keys present in domain."""
+    fields = [f for f in EIP712_DOMAIN_FIELDS if f["name"] in domain]
+    return _hash_struct("EIP712Domain", fields, domain)
+
 
 @dataclass
 class Order:
@@ -143,6 +201,9 @@ class OrderSigner:
         ]
     }
 
+    # Shared by every order signature (computed once)
+    DOMAIN_SEPARATOR = _domain_separator(DOMAIN)
+
     def __init__(self, private_key: str):
         """
         Initialize signer with a private key.
@@ -234,10 +295,30 @@ class OrderSigner:
         signed = self.wallet.sign_message(signable)
         return "0x" + signed.signature.hex()
 
+    def _order_message(self, order: Order) -> Dict[str, Any]:
+        """Build the EIP-712 Order message, keyed by ORDER_TYPES field names."""
+        return {
+            "salt": 0,
+            "maker": to_checksum_address(order.maker),
+            "signer": self.address,
+            "taker": ZERO_ADDRESS,
+            "tokenId": int(order.token_id),
+            "makerAmount": int(order.maker_amount),
+            "takerAmount": int(order.taker_amount),
+            "expiration": 0,
+            "nonce": order.nonce,
+            "feeRateBps": order.fee_rate_bps,
+            "side": order.side_value,
+            "signatureType": order.signature_type,
+        }
+
     def sign_order(self, order: Order) -> Dict[str, Any]:
         """
         Sign a Polymarket order.
 
+        Uses the precomputed DOMAIN_SEPARATOR, so only the order's struct
+        hash is computed per call.
+
         Args:
             order: Order instance to sign
 
@@ -248,29 +329,13 @@ class OrderSigner:
             SignerError: If signing fails
         """
         try:
-            # Build order message for EIP-712
-            order_message = {
-                "salt": 0,
-                "maker": to_checksum_address(order.maker),
-                "signer": self.address,
-                "taker": "0x0000000000000000000000000000000000000000",
-                "tokenId": int(order.token_id),
-                "makerAmount": int(order.maker_amount),
-                "takerAmount": int(order.taker_amount),
-                "expiration": 0,
-                "nonce": order.nonce,
-                "feeRateBps": order.fee_rate_bps,
-                "side": order.side_value,
-                "signatureType": order.signature_type,
-            }
-
-            # Sign the order using new API format
-            signable = encode_typed_data(
-                domain_data=self.DOMAIN,
-                message_types=self.ORDER_TYPES,
-                message_data=order_message
+            signable = SignableMessage(
+                version=b"\x01",
+                header=self.DOMAIN_SEPARATOR,
+                body=_hash_struct(
+                    "Order", self.ORDER_TYPES["Order"], self._order_message(order)
+                ),
             )
-
             signed = self.wallet.sign_message(signable)
 
             return {
@@ -344,5 +409,36 @@ class OrderSigner:
         return "0x" + signed.signature.hex()
 
 
+def _check_order_encoding() -> None:
+    """
+    Check the precomputed order hashing against eth_account's encode_typed_data.
+
+    Runs once at import so a change to DOMAIN or ORDER_TYPES that the
+    hand-rolled encoding does not handle fails loudly instead of producing
+    invalid order signatures.
+    """
+    fields = OrderSigner.ORDER_TYPES["Order"]
+    sample: Dict[str, Any] = {}
+    for i, f in enumerate(fields, start=1):
+        if f["type"] == "address":
+            sample[f["name"]] = to_checksum_address(f"0x{i:040x}")
+        elif f["type"] == "string":
+            sample[f["name"]] = f["name"]
+        else:
+            sample[f["name"]] = i
+
+    expected = encode_typed_data(
+        domain_data=OrderSigner.DOMAIN,
+        message_types=OrderSigner.ORDER_TYPES,
+        message_data=sample
+    )
+    actual_body = _hash_struct("Order", fields, sample)
+    if expected.header != OrderSigner.DOMAIN_SEPARATOR or expected.body != actual_body:
+        raise SignerError("Order EIP-712 encoding does not match encode_typed_data")
+
+
+_check_order_encoding()
+
+
 # Alias for backwards compatibility
 WalletSigner = OrderSigner
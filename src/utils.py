@@ -15,6 +15,7 @@ Example:
         print("Valid address!")
 """
 
+import re
 from typing import Tuple
 
 from .config import Config, get_env
@@ -22,6 +23,10 @@ from .bot import TradingBot
 from .crypto import verify_private_key
 
 
+# 0x followed by exactly 40 hex characters
+ADDRESS_RE = re.compile(r"0x[0-9a-fA-F]{40}")
+
+
 def validate_address(address: str) -> bool:
     """
     Check if a string is a valid Ethereum address.
@@ -41,19 +46,8 @@ def validate_address(address: str) -> bool:
     if not address:
         return False
 
-    # Must start with 0x and be 42 characters total
-    if not address.startswith("0x"):
-        return False
-
-    if len(address) != 42:
-        return False
-
-    # Must be valid hex
-    try:
-        int(address, 16)
-        return True
-    except ValueError:
-        return False
+    # Must be 0x + 40 hex characters (42 total)
+    return ADDRESS_RE.fullmatch(address) is not None
 
 
 def validate_private_key(key: str) -> Tuple[bool, str]:
@@ -243,6 +243,8 @@ class MarketWebSocket:
 
         # Connection state
         self._ws: Optional["WebSocketClientProtocol"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._close_task: Optional["asyncio.Task[None]"] = None
         self._running = False
         self._subscribed_assets: Set[str] = set()
 
@@ -335,6 +337,7 @@ class MarketWebSocket:
                 ping_interval=self.ping_interval,
                 ping_timeout=self.ping_timeout,
             )
+            self._loop = asyncio.get_running_loop()
             logger.info(f"WebSocket connected to {self.url}")
             if self._on_connect:
                 self._on_connect()
@@ -461,12 +464,15 @@ class MarketWebSocket:
     async def _handle_message(self, data: Dict[str, Any]) -> None:
         """Handle incoming WebSocket message."""
         event_type = data.get("event_type", "")
-        logger.debug(f"Received event: {event_type}, keys: {list(data.keys())}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"Received event: {event_type}, keys: {list(data.keys())}")
 
         if event_type == "book":
             snapshot = OrderbookSnapshot.from_message(data)
             self._orderbooks[snapshot.asset_id] = snapshot
-            logger.debug(f"Book update for {snapshot.asset_id[:20]}...: mid={snapshot.mid_price:.4f}")
+            if debug:
+                logger.debug(f"Book update for {snapshot.asset_id[:20]}...: mid={snapshot.mid_price:.4f}")
             await self._run_callback(self._on_book, snapshot, label="book")
 
         elif event_type == "price_change":
@@ -505,14 +511,19 @@ class MarketWebSocket:
             logger.error(f"Error in {label} callback: {e}")
 
     async def _run_loop(self) -> None:
-        """Main message processing loop."""
+        """
+        Main message processing loop.
+
+        Frames already buffered by the connection are returned by recv()
+        without waiting, so a burst is drained back-to-back. Dead
+        connections are detected by the keepalive ping, and stop() closes
+        the socket; either way recv() raises ConnectionClosed and the loop
+        ends.
+        """
         msg_count = 0
         while self._running and self.is_connected:
             try:
-                message = await asyncio.wait_for(
-                    self._ws.recv(),
-                    timeout=self.ping_interval + 5
-                )
+                message = await self._ws.recv()
                 msg_count += 1
 
                 # Log first 5 messages, then every 1000
@@ -528,10 +539,9 @@ class MarketWebSocket:
                 else:
                     await self._handle_message(data)
 
-            except asyncio.TimeoutError:
-                logger.warning("WebSocket receive timeout")
             except self._connection_closed as e:
-                logger.warning(f"WebSocket connection closed: {e}")
+                if self._running:
+                    logger.warning(f"WebSocket connection closed: {e}")
                 break
             except json.JSONDecodeError as e:
                 logger.error(f"Failed to parse message: {e}")
@@ -588,9 +598,29 @@ class MarketWebSocket:
             await self.disconnect()
 
     def stop(self) -> None:
-        """Stop the WebSocket client."""
+        """
+        Stop the WebSocket client.
+
+        Also closes the open connection, so a run() blocked in recv() on a
+        quiet feed returns now instead of at the next frame. Safe to call
+        from the event loop or from another thread.
+        """
         self._running = False
 
+        ws, loop = self._ws, self._loop
+        if ws is None or loop is None or loop.is_closed():
+            return
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is loop:
+            self._close_task = loop.create_task(ws.close())
+        else:
+            asyncio.run_coroutine_threadsafe(ws.close(), loop)
+
 
 class OrderbookManager:
     """